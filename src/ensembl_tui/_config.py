@@ -1,5 +1,6 @@
 import configparser
 import fnmatch
+import functools
 import pathlib
 import sys
 from collections.abc import Iterable
@@ -51,11 +52,13 @@ class Config:
         self.staging_path = pathlib.Path(self.staging_path)
         self.install_path = pathlib.Path(self.install_path)
 
-    @property
+    # derived paths are cached on first access, so staging_path and
+    # install_path should not be modified after construction
+    @functools.cached_property
     def remote_release_path(self) -> str:
         return f"{self.remote_path}/release-{self.release}"
 
-    @property
+    @functools.cached_property
     def staging_template_path(self) -> pathlib.Path:
         return self.staging_genomes / "coredb_templates"
 
@@ -67,42 +70,45 @@ class Config:
                 msg = f"Unknown species {k=!r}"
                 raise ValueError(msg)
         self.species_dbs |= species
-
-    @property
-    def db_names(self) -> Iterable[str]:
-        for species in self.species_dbs:
-            yield eti_species.Species.get_ensembl_db_prefix(species)
-
-    @property
+        # invalidate the cached value
+        self.__dict__.pop("db_names", None)
+
+    @functools.cached_property
+    def db_names(self) -> tuple[str, ...]:
+        # species synonyms map to the same db name, so we drop duplicates
+        return tuple(
+            dict.fromkeys(
+                eti_species.Species.get_ensembl_db_prefix(species)
+                for species in self.species_dbs
+            ),
+        )
+
+    @functools.cached_property
     def staging_genomes(self) -> pathlib.Path:
         return self.staging_path / _GENOMES_NAME
 
-    @property
+    @functools.cached_property
     def install_genomes(self) -> pathlib.Path:
         return self.install_path / _GENOMES_NAME
 
-    @property
+    @functools.cached_property
     def staging_homologies(self) -> pathlib.Path:
         return self.staging_path / _COMPARA_NAME / _HOMOLOGIES_NAME
 
-    @property
+    @functools.cached_property
     def install_homologies(self) -> pathlib.Path:
         return self.install_path / _COMPARA_NAME / _HOMOLOGIES_NAME
 
-    @property
+    @functools.cached_property
     def staging_aligns(self) -> pathlib.Path:
         return self.staging_path / _COMPARA_NAME / _ALIGNS_NAME
 
-    @property
+    @functools.cached_property
     def install_aligns(self) -> pathlib.Path:
         return self.install_path / _COMPARA_NAME / _ALIGNS_NAME
 
     def to_dict(self, relative_paths: bool = True) -> dict[str, str]:
         """returns cfg as a dict"""
-        if not self.db_names:
-            msg = "no db names"
-            raise ValueError(msg)
-
         if not relative_paths:
             staging_path = str(self.staging_path)
             install_path = str(self.install_path)
@@ -254,6 +260,25 @@ def _standardise_path(
     return path if path.is_absolute() else (config_path / path).resolve()
 
 
+def _split_csv(
+    parser: configparser.ConfigParser,
+    section: str,
+    option: str,
+    required: bool = False,
+) -> list[str]:
+    """returns the stripped, non-empty, comma separated values of option
+
+    Notes
+    -----
+    If option is absent, raises configparser.NoOptionError when required,
+    otherwise returns an empty list.
+    """
+    if not required and not parser.has_option(section, option):
+        return []
+    value = parser.get(section, option)
+    return [v for v in (v.strip() for v in value.split(",")) if v]
+
+
 def read_config(
     config_path: pathlib.Path,
     root_dir: pathlib.Path | None = None,
@@ -284,7 +309,6 @@ def read_config(
 
     homologies = parser.has_option("compara", "homologies")
     species_dbs = {}
-    get_option = parser.get
     align_names = []
     tree_names = []
     for section in parser.sections():
@@ -292,13 +316,11 @@ def read_config(
             continue
 
         if section == "compara":
-            value = get_option(section, "align_names", fallback=None)
-            align_names = [] if value is None else [n.strip() for n in value.split(",")]
-            value = get_option(section, "tree_names", fallback=None)
-            tree_names = [] if value is None else [n.strip() for n in value.split(",")]
+            align_names = _split_csv(parser, section, "align_names")
+            tree_names = _split_csv(parser, section, "tree_names")
             continue
 
-        dbs = [db.strip() for db in get_option(section, "db").split(",")]
+        dbs = _split_csv(parser, section, "db", required=True)
 
         # handle synonyms
         species = eti_species.Species.get_species_name(section, level="raise")
@@ -1,3 +1,6 @@
+import contextlib
+import functools
+import os
 import pathlib
 import re
 import shutil
@@ -322,16 +325,59 @@ def download_homology(
     return
 
 
-def download_ensembl_tree(
+def _get_tree_cache_dir() -> pathlib.Path:
+    """directory for caching downloaded Ensembl trees"""
+    root = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return pathlib.Path(root).expanduser() / "ensembl_tui" / "trees"
+
+
+@functools.cache
+def _get_ensembl_treestring(
     host: str,
     remote_path: str,
     release: str,
     tree_fname: str,
-) -> cogent3.core.tree.PhyloNode:
-    """loads a tree from Ensembl"""
+) -> str:
+    """returns newick string of an Ensembl tree, from the disk cache if present"""
+    # remote_path is part of the url, so is part of the cache key, dropping
+    # components that could escape the cache directory
+    remote_parts = [p for p in remote_path.split("/") if p not in ("", ".", "..")]
+    cache_path = _get_tree_cache_dir().joinpath(
+        host,
+        *remote_parts,
+        str(release),
+        tree_fname,
+    )
+    if cache_path.exists():
+        return cache_path.read_text()
+
     site_map = eti_site_map.get_site_map(host)
     url = f"https://{host}/{remote_path}/release-{release}/{site_map.trees_path}/{tree_fname}"
-    return cogent3.load_tree(url)
+    treestring = cogent3.load_tree(url).get_newick(with_distances=True)
+    # a failure to write the cache is not fatal
+    with contextlib.suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with eti_util.atomic_write(cache_path, mode="w") as out:
+            out.write(treestring)
+    return treestring
+
+
+def download_ensembl_tree(
+    host: str,
+    remote_path: str,
+    release: str,
+    tree_fname: str,
+) -> cogent3.core.tree.PhyloNode:
+    """loads a tree from Ensembl
+
+    Notes
+    -----
+    Trees are cached on disk, under $XDG_CACHE_HOME/ensembl_tui/trees
+    (defaulting to ~/.cache) keyed by host, remote path and release, and
+    within the process, so they are only downloaded once.
+    """
+    treestring = _get_ensembl_treestring(host, remote_path, str(release), tree_fname)
+    return cogent3.make_tree(treestring=treestring)
 
 
 def get_ensembl_trees(host: str, remote_path: str, release: str) -> list[str]:
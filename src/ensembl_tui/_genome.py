@@ -1,5 +1,6 @@
 import dataclasses
 import functools
+import os
 import pathlib
 import sys
 import typing
@@ -50,29 +51,42 @@ class fasta_to_hdf5:  # noqa: N801
         self,
         config: eti_config.Config,
         label_to_name: Callable[[str], str] = _rename,
+        nthreads: int | None = None,
     ) -> None:
+        """
+        Parameters
+        ----------
+        config
+            the download / install configuration
+        label_to_name
+            converts a fasta label to the seqid
+        nthreads
+            number of threads used by the blosc2 compressor when writing
+            each sequence
+        """
         self.config = config
         self.label_to_name = label_to_name
+        self.nthreads = nthreads
 
     def main(self, db_name: str) -> bool:
-        src_dir = self.config.staging_genomes / db_name
-        dest_dir = self.config.install_genomes / db_name
+        src_dir = os.path.join(self.config.staging_genomes, db_name, "fasta")
+        dest_dir = os.path.join(self.config.install_genomes, db_name)
 
         seq_store = SeqsDataHdf5(
-            source=dest_dir / SEQ_STORE_NAME,
+            source=os.path.join(dest_dir, SEQ_STORE_NAME),
             species=eti_species.Species.get_species_name(db_name),
             mode="w",
         )
 
-        src_dir = src_dir / "fasta"
-        for path in src_dir.glob("*.fa.gz"):
-            for seqid, seq in iter_fasta_records(
-                path,
-                converter=bytes_to_array,
-                label_to_name=self.label_to_name,
-            ):
-                seq_store.add_record(seq, seqid)
-                del seq
+        with eti_util.blosc_nthreads(self.nthreads):
+            for path in eti_util.scandir_matching(src_dir, "*.fa.gz"):
+                for seqid, seq in iter_fasta_records(
+                    path,
+                    converter=bytes_to_array,
+                    label_to_name=self.label_to_name,
+                ):
+                    seq_store.add_record(seq, seqid)
+                    del seq
 
         seq_store.close()
 
@@ -221,7 +235,9 @@ class SeqsDataHdf5(eti_storage.Hdf5Mixin, SeqsDataABC):
     def _(self, seq: numpy.ndarray, seqid: str) -> None:
         if seqid in self._file:
             stored = self._file[seqid]
-            if (seq == stored).all():
+            # check the shape first, comparing arrays of different length
+            # raises numpy's broadcast error rather than ours
+            if stored.shape == seq.shape and (seq == stored[:]).all():
                 # already seen this seq
                 return
             # but it's different, which is a problem
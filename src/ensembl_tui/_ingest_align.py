@@ -1,10 +1,10 @@
+import os
 import pathlib
 import typing
 
 import duckdb
 import numpy
 import rich.progress as rich_progress
-from cogent3 import make_seq
 from cogent3.app.composable import LOADER, define_app
 from cogent3.app.typing import IdentifierType
 
@@ -15,39 +15,54 @@ from ensembl_tui import _util as eti_util
 from ensembl_tui._maf import parse
 
 _no_gaps = numpy.array([], dtype=numpy.int32)
+_gap_char = ord("-")
+
+
+def get_gap_spans(seq: str) -> numpy.ndarray:
+    """returns [[gap position, gap length], ...] for gaps in seq
+
+    Notes
+    -----
+    Gap positions are in ungapped sequence coordinates. A single vectorised
+    pass over the sequence bytes, avoiding construction of a Sequence.
+    """
+    is_gap = numpy.frombuffer(seq.encode("ascii"), dtype=numpy.uint8) == _gap_char
+    if not is_gap.any():
+        return _no_gaps
+
+    # +1 at the start of each gap run, -1 at the end
+    diff = numpy.diff(is_gap.view(numpy.int8), prepend=0, append=0)
+    starts = numpy.flatnonzero(diff == 1)
+    lengths = numpy.flatnonzero(diff == -1) - starts
+    # shift aligned start positions by the gap length preceding them
+    gap_pos = starts - numpy.concatenate(([0], numpy.cumsum(lengths)[:-1]))
+    return numpy.array([gap_pos, lengths], dtype=numpy.int32).T
 
 
 def seq2gaps(record: dict) -> eti_align.AlignRecord:
-    seq = make_seq(record.pop("seq"), new_type=True, moltype="dna")
-    indel_map, _ = seq.parse_out_gaps()
-    if indel_map.num_gaps:
-        record["gap_spans"] = numpy.array(
-            [indel_map.gap_pos, indel_map.get_gap_lengths()],
-            dtype=numpy.int32,
-        ).T
-    else:
-        record["gap_spans"] = _no_gaps
+    record["gap_spans"] = get_gap_spans(record.pop("seq"))
     return eti_align.AlignRecord(**record)
 
 
 @define_app(app_type=LOADER)
 class load_align_records:  # noqa: N801
     def __init__(self, species: set[str] | None = None) -> None:
-        self.species = species or {}
+        self.species = frozenset(species or ())
 
     def main(self, path: IdentifierType) -> list[eti_align.AlignRecord]:
+        # bound as locals since these are used for every row
+        species = self.species
+        source = os.path.basename(path)
         records = []
         for block_id, align in parse(path):
-            converted = []
-            for maf_name, seq in align.items():
-                if self.species and maf_name.species not in self.species:
+            for maf_name, seq in align:
+                if species and maf_name.species not in species:
                     continue
                 record = maf_name.to_dict()
                 record["block_id"] = block_id
-                record["source"] = path.name
+                record["source"] = source
                 record["seq"] = seq
-                converted.append(seq2gaps(record))
-            records.extend(converted)
+                records.append(seq2gaps(record))
         return records
 
 
@@ -63,7 +78,6 @@ def add_records(
     conn: duckdb.DuckDBPyConnection,
     records: typing.Sequence[eti_align.AlignRecord],
     gap_store: eti_align.GapStore,
-    progress: rich_progress.Progress | None = None,
 ) -> None:
     if not records:
         return
@@ -74,27 +88,35 @@ def add_records(
     sql = f"SELECT DISTINCT(block_id) from align_blocks WHERE block_id IN ({val_placeholder})"
     used = {r[0] for r in conn.sql(sql, params=block_ids).fetchall()}
 
+    records = [r for r in records if r.block_id not in used]
+    if not records:
+        return
+
+    # reserve an align_id for every record in a single query, then insert
+    # all rows in one transaction
+    sql = f"SELECT nextval('align_id_seq') FROM range({len(records)})"
+    indices = [r[0] for r in conn.sql(sql).fetchall()]
+    col_order = ["align_id", *col_order]
     val_placeholder = ", ".join("?" * len(col_order))
     sql = (
         f"INSERT INTO align_blocks ({', '.join(col_order)}) VALUES ({val_placeholder})"
     )
-    rowid_sql = "SELECT currval('align_id_seq')"
-    if progress is not None:
-        msg = "Writings aligns ✍️"
-        writing = progress.add_task(total=len(records), description=msg, advance=0)
-
-    for record in records:
-        if record.block_id in used:
-            continue
-
-        conn.sql(sql, params=[record[c] for c in col_order])
-        index = conn.sql(rowid_sql).fetchone()[0]
+    conn.begin()
+    try:
+        conn.executemany(
+            sql,
+            parameters=[
+                [index, *(record[c] for c in col_order[1:])]
+                for index, record in zip(indices, records, strict=True)
+            ],
+        )
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+
+    for index, record in zip(indices, records, strict=True):
         gap_store.add_record(index=index, gaps=record.gap_spans)
-        if progress is not None:
-            progress.update(writing, description=msg, advance=1)
-
-    if progress is not None:
-        progress.remove_task(writing)
 
 
 def install_alignment(
@@ -107,14 +129,19 @@ def install_alignment(
     dest_dir = config.install_aligns / align_name
 
     dest_dir.mkdir(parents=True, exist_ok=True)
-    paths = list(src_dir.glob(f"{align_name}*maf*"))
+    paths = sorted(eti_util.scandir_matching(src_dir, f"{align_name}*maf*"))
     aln_loader = load_align_records(set(config.db_names))
     agg = make_alignment_aggregator_db()
-    records = []
+    # records from each file are written as they arrive, with a bounded
+    # number of files in flight, rather than all held in memory at once.
+    # When a block_id occurs in more than one file only the first to
+    # arrive is kept, so with multiple workers the source recorded for
+    # such blocks (and align_id values) can differ between runs.
     series = eti_util.get_iterable_tasks(
         func=aln_loader,
         series=paths,
         max_workers=max_workers,
+        max_pending=2 * (max_workers or os.cpu_count() or 1),
     )
     gap_path = dest_dir / f"{dest_dir.stem}.{eti_align.GAP_STORE_SUFFIX}"
 
@@ -125,6 +152,7 @@ def install_alignment(
         in_memory=False,
     )
 
+    # records are written as each file is read, so this tracks both
     if progress is not None:
         msg = "Reading aligns 📖"
         reading = progress.add_task(total=len(paths), description=msg, advance=0)
@@ -134,7 +162,8 @@ def install_alignment(
             msg = f"{result=}"
             raise RuntimeError(msg)
 
-        records.extend(result)
+        add_records(conn=agg, records=result, gap_store=gap_store)
+        del result
 
         if progress is not None:
             progress.update(reading, description=msg, advance=1)
@@ -142,7 +171,6 @@ def install_alignment(
     if progress is not None:
         progress.remove_task(reading)
 
-    add_records(conn=agg, records=records, gap_store=gap_store, progress=progress)
     gap_store.close()
     # write the parquet file, returns patrh to that file
     return eti_db_ingest.export_parquet(
@@ -81,21 +81,19 @@ class load_homologies:  # noqa: N801
             "homology_species",
             "homology_gene_stable_id",
         )
-        self._create_sql = (
-            f"CREATE TABLE my_table AS SELECT {','.join(self._src_cols)} FROM"
-            " read_csv_auto('{}', delim='\t', header=True)"
-        )
-        allowed = ", ".join(f"{sp!r}" for sp in allowed_species)
+        # the species filter is applied as the file is read, so only the
+        # matching rows of the projected columns are materialised
+        allowed = ", ".join(f"{sp!r}" for sp in sorted(allowed_species))
         self._select_sql = (
-            f"SELECT {','.join(self._src_cols)} FROM my_table"
+            f"SELECT {','.join(self._src_cols)} FROM"
+            " read_csv_auto('{}', delim='\t', header=True)"
             f" WHERE species IN ({allowed}) AND homology_species IN ({allowed})"
         )
 
     def main(self, path: c3_types.IdentifierType) -> c3_types.SerialisableType:
         conn = duckdb.connect(":memory:")
-        sql = self._create_sql.format(path)
-        conn.sql(sql)
-        return grouped_related(conn.sql(self._select_sql).fetchall())
+        sql = self._select_sql.format(path)
+        return grouped_related(conn.sql(sql).fetchall())
 
 
 class HomologyAggregator:
@@ -106,23 +104,30 @@ class HomologyAggregator:
     def add_records(
         self,
         *,
-        records: typing.Sequence[eti_homology.homolog_group],
+        records: typing.Iterable[eti_homology.homolog_group],
         relationship_type: str,
+        batch_size: int = 50_000,
     ) -> None:
         """inserts homology data from records
 
         Parameters
         ----------
         records
-            a sequence of homolog group instances, all with the same
-            relationship type
+            homolog group instances, all with the same relationship type
         relationship_type
             the relationship type
+        batch_size
+            maximum number of rows held in memory before they are written
         """
         if not relationship_type:
             msg = f"invalid {relationship_type=!r}"
             raise ValueError(msg)
 
+        placeholder = ", ".join("?" * (len(eti_homology.HOMOLOGY_ATTR_COLS) - 1))
+        cols = ", ".join(eti_homology.HOMOLOGY_ATTR_COLS[1:])
+        sql = (
+            f"INSERT OR IGNORE INTO homology_groups_attr({cols}) VALUES ({placeholder})"
+        )
         values = []
         for homology_id, group in enumerate(records, start=self._homology_id + 1):
             if group.relationship != relationship_type:
@@ -131,23 +136,20 @@ class HomologyAggregator:
 
             # get geneids and species for this group, storing the
             # geneid id for each record
-
             values.extend(
                 [
                     (homology_id, gene_id, species, relationship_type)
                     for gene_id, species in group.gene_ids.items()
                 ],
             )
-
-        # record last homology_index
-        self._homology_id = homology_id
-        # create the homology table entries
-        placeholder = ", ".join("?" * (len(eti_homology.HOMOLOGY_ATTR_COLS) - 1))
-        cols = ", ".join(eti_homology.HOMOLOGY_ATTR_COLS[1:])
-        sql = (
-            f"INSERT OR IGNORE INTO homology_groups_attr({cols}) VALUES ({placeholder})"
-        )
-        self.conn.executemany(sql, parameters=values)
+            # record last homology_index
+            self._homology_id = homology_id
+            if len(values) >= batch_size:
+                self.conn.executemany(sql, parameters=values)
+                values.clear()
+
+        if values:
+            self.conn.executemany(sql, parameters=values)
 
 
 def make_homology_aggregator_db() -> HomologyAggregator:
@@ -1,3 +1,4 @@
+import os
 import shutil
 
 from rich.progress import Progress
@@ -11,6 +12,12 @@ from ensembl_tui import _species as eti_species
 from ensembl_tui import _util as eti_util
 
 
+def _install_genome_part(task: tuple) -> tuple:
+    """applies the writer to a db_name, returning the phase label and result"""
+    kind, writer, db_name = task
+    return kind, writer(db_name)
+
+
 def local_install_genomes(
     config: eti_config.Config,
     force_overwrite: bool,
@@ -23,66 +30,61 @@ def local_install_genomes(
     # we create the local installation
     config.install_genomes.mkdir(parents=True, exist_ok=True)
     # we create subdirectories for each species
-    for db_name in list(config.db_names):
-        sp_dir = config.install_genomes / db_name
-        sp_dir.mkdir(parents=True, exist_ok=True)
-
-    # for each species, we identify the download and dest paths for annotations
-    db_names = list(config.db_names)
+    db_names = config.db_names
+    install_root = os.fspath(config.install_genomes)
+    for db_name in db_names:
+        os.makedirs(os.path.join(install_root, db_name), exist_ok=True)
+
+    # features and sequences for each species are independent tasks, so we
+    # schedule both phases on the one worker pool, allowing them to overlap
+    series = [("features", db_name) for db_name in db_names] + [
+        ("seqs", db_name) for db_name in db_names
+    ]
     if max_workers:
-        max_workers = min(len(db_names) + 1, max_workers)
+        max_workers = min(len(series), max_workers)
 
     if verbose:
         eti_util.print_colour(f"\nInstalling genomes {max_workers=}", "yellow")
 
-    # we do this the installation of features in serial for now
-    writer = eti_db_ingest.mysql_dump_to_parquet(config=config)
-    tasks = eti_util.get_iterable_tasks(
-        func=writer,
-        series=db_names,
-        max_workers=max_workers,
-    )
-    if progress is not None:
-        msg = "Installing features 📚"
-        write_features = progress.add_task(
-            total=len(db_names),
-            description=msg,
-            advance=0,
-        )
-
-    for result in tasks:
-        if not result:
-            msg = f"{result=}"
-            raise RuntimeError(msg)
-
-        if progress is not None:
-            progress.update(write_features, description=msg, advance=1)
-
     species_table = eti_species.Species.to_table()
     species_table.write(config.install_genomes / eti_species.SPECIES_NAME)
-    if verbose:
-        eti_util.print_colour("\nFinished installing features", "yellow")
 
-    if progress is not None:
-        msg = "Installing  🧬🧬"
-        write_seqs = progress.add_task(total=len(db_names), description=msg, advance=0)
-    # we parallelise across databases
-    writer = eti_genome.fasta_to_hdf5(config=config)
+    # cores not used by a worker process are given to the compressor, only
+    # seqs tasks compress so at most one per species can be compressing
+    num_seq_workers = min(len(db_names), max_workers or (os.cpu_count() or 1))
+    writers = {
+        "features": eti_db_ingest.mysql_dump_to_parquet(config=config),
+        "seqs": eti_genome.fasta_to_hdf5(
+            config=config,
+            nthreads=eti_util.get_spare_threads(num_seq_workers),
+        ),
+    }
     tasks = eti_util.get_iterable_tasks(
-        func=writer,
-        series=db_names,
+        func=_install_genome_part,
+        series=[(kind, writers[kind], db_name) for kind, db_name in series],
         max_workers=max_workers,
     )
-    for result in tasks:
+    if progress is not None:
+        msgs = {"features": "Installing features 📚", "seqs": "Installing  🧬🧬"}
+        progress_tasks = {
+            kind: progress.add_task(total=len(db_names), description=msg, advance=0)
+            for kind, msg in msgs.items()
+        }
+
+    for kind, result in tasks:
         if not result:
             msg = f"{result=}"
             raise RuntimeError(msg)
 
         if progress is not None:
-            progress.update(write_seqs, description=msg, advance=1)
+            progress.update(
+                progress_tasks[kind],
+                description=msgs[kind],
+                advance=1,
+            )
 
     if verbose:
-        eti_util.print_colour("\nFinished installing sequences", "yellow")
+        eti_util.print_colour("\nFinished installing features and sequences", "yellow")
 
 
 def local_install_alignments(
@@ -119,10 +121,12 @@ def local_install_homology(
 
     config.install_homologies.mkdir(parents=True, exist_ok=True)
 
+    staging_root = os.fspath(config.staging_homologies)
     dirnames = []
     for sp in config.db_names:
-        path = config.staging_homologies / sp
-        dirnames.extend(list(path.glob("*.tsv*")))
+        dirnames.extend(
+            eti_util.scandir_matching(os.path.join(staging_root, sp), "*.tsv*"),
+        )
 
     max_workers = min(len(dirnames) + 1, max_workers) if max_workers else 1
 
@@ -158,29 +162,14 @@ def local_install_homology(
 
     if progress is not None:
         progress.remove_task(load_homs)
-        msg = "Aggregating homologies"
-        agg = progress.add_task(
-            total=len(results),
-            description=msg,
-            advance=0,
-            transient=True,
-        )
-
-    # we merge the homology groups
-    for rel_type, records in results.items():
-        results[rel_type] = homology_ingest.merge_grouped(records)
-
-        if progress is not None:
-            progress.update(agg, description=msg, advance=1)
-
-    # write the homology groups to in-memory db
-    if progress is not None:
-        progress.remove_task(agg)
         msg = "Installing homologies"
         write = progress.add_task(total=len(results), description=msg, advance=0)
 
+    # we merge the homology groups and write them to the in-memory db one
+    # relationship type at a time, releasing each once written
     db = homology_ingest.make_homology_aggregator_db()
-    for rel_type, records in results.items():
+    for rel_type in list(results):
+        records = homology_ingest.merge_grouped(results.pop(rel_type))
         db.add_records(records=records, relationship_type=rel_type)
         if progress is not None:
             progress.update(write, description=msg, advance=1)
@@ -10,22 +10,27 @@ from ensembl_tui import _name as eti_name
 from ensembl_tui import _util as eti_util
 
 _id_pattern = re.compile(r"(?<=id[:])\s*\d+")
+# s src.seqid start size strand src_size seq, species is up to the first "."
+_s_line_pattern = re.compile(
+    r"s\s+([^.\s]+)\.(\S+)\s+(\d+)\s+(\d+)\s+([+-])\s+(\d+)\s+(\S+)",
+)
+_match_s_line = _s_line_pattern.match
 
+# species and seqid strings repeat across every block, we reuse a single
+# instance of each. The caches are capped so memory stays bounded when
+# there are many distinct seqids (e.g. scaffolds).
+_max_cached_names = 10_000
+_species_names: dict[str, str] = {}
+_seqids: dict[str, str] = {}
 
-def _get_alignment_block_indices(data: list[str]) -> list[tuple[int, int]]:
-    blocks = []
-    start = None
-    for i, line in enumerate(data):
-        if _id_pattern.search(line):
-            if start is not None:
-                blocks.append((start, i))
-            start = i
 
-    if start is None:
-        return []
-
-    blocks.append((start, i))
-    return blocks
+def _reuse_str(cache: dict[str, str], value: str) -> str:
+    """returns the cached instance equal to value, caching value if space"""
+    if (cached := cache.get(value)) is not None:
+        return cached
+    if len(cache) < _max_cached_names:
+        cache[value] = value
+    return value
 
 
 def process_id_line(line: str) -> int:
@@ -38,8 +43,13 @@ def process_id_line(line: str) -> int:
 
 def process_maf_line(line: str) -> tuple[eti_name.MafName, str]:
     # after the s token we have src.seqid, start, size, strand, src_size, seq
-    _, src_coord, start, size, strand, coord_length, seq = line.strip().split()
-    species, coord = src_coord.split(".", maxsplit=1)
+    if (match := _match_s_line(line)) is None:
+        msg = f"{line=} is not a sequence line"
+        raise ValueError(msg)
+
+    species, coord, start, size, strand, coord_length, seq = match.groups()
+    species = _reuse_str(_species_names, species)
+    coord = _reuse_str(_seqids, coord)
     start, size, coord_length = int(start), int(size), int(coord_length)
     if strand == "-":
         start = coord_length - (start + size)
@@ -56,23 +66,34 @@ def process_maf_line(line: str) -> tuple[eti_name.MafName, str]:
     return n, seq
 
 
-def _get_seqs(lines: list[str]) -> dict[eti_name.MafName, str]:
-    alignment = {}
-    for line in lines:
-        if not line.startswith("s") or "ancestral" in line[:100]:
-            continue
-        n, seq = process_maf_line(line)
-        alignment[n] = seq
-    return alignment
+def _get_seqs(lines: list[str]) -> list[tuple[eti_name.MafName, str]]:
+    return [process_maf_line(line) for line in lines]
 
 
 def parse(
     path: eti_util.PathType,
-) -> typing.Iterable[tuple[int, dict[eti_name.MafName, str]]]:
+) -> typing.Iterable[tuple[int, list[tuple[eti_name.MafName, str]]]]:
+    """yields block id and [(MafName, seq), ...] for each alignment block
+
+    Notes
+    -----
+    Sequences are in the order they appear in the file. Only the current
+    block is held in memory.
+    """
+    block_id = None
+    lines = []
     with open_(path) as infile:
-        data = infile.readlines()
-
-    blocks = _get_alignment_block_indices(data)
-    for block_start, block_end in blocks:
-        block_id = process_id_line(data[block_start])
-        yield block_id, _get_seqs(data[block_start + 1 : block_end])
+        for line in infile:
+            if line.startswith("s"):
+                if "ancestral" not in line[:100]:
+                    lines.append(line)
+            # block ids are in comment lines, checking the prefix first means
+            # "a", "i", "e", "q" and blank lines never reach the regex
+            elif line.startswith("#") and _id_pattern.search(line):
+                if block_id is not None:
+                    yield block_id, _get_seqs(lines)
+                block_id = process_id_line(line)
+                lines = []
+
+    if block_id is not None:
+        yield block_id, _get_seqs(lines)
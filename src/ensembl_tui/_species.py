@@ -1,5 +1,6 @@
 import os
 import pathlib
+import sys
 import typing
 
 from cogent3 import load_table
@@ -23,11 +24,22 @@ def load_species(species_path: eti_util.PathType) -> list[list[str]]:
     return table.to_list()
 
 
+def _make_key(name: str) -> str:
+    """returns the lower case form of name for use as a dict key"""
+    return str(name).lower()
+
+
 _species_common_map = load_species(os.path.join(eti_util.ENSEMBLDBRC, SPECIES_NAME))
 
 
 class SpeciesNameMap:
-    """mapping between common names and latin names"""
+    """mapping between common names and latin names
+
+    Notes
+    -----
+    Lookups are case-insensitive. Dict keys are interned lower case strings,
+    values retain the case of the original names.
+    """
 
     def __init__(self, species_common=_species_common_map):
         """provides latin name:common name mappings"""
@@ -37,7 +49,6 @@ class SpeciesNameMap:
         self._ensembl_species = {}
         self._stableid_species = {}  # stable id prefix to species map
         for names in species_common:
-            names = list(map(eti_util.CaseInsensitiveString, names))
             self.amend_species(*names)
 
     def __str__(self) -> str:
@@ -47,31 +58,37 @@ class SpeciesNameMap:
         return repr(self.to_table())
 
     def __contains__(self, item) -> bool:
-        item = eti_util.CaseInsensitiveString(item)
-        return any(
-            item in attr
-            for attr in (
-                self._species_common,
-                self._common_species,
-                self._ensembl_species,
-            )
+        key = _make_key(item)
+        return (
+            key in self._species_common
+            or key in self._common_species
+            or key in self._ensembl_species
         )
 
     def _repr_html_(self) -> str:
         table = self.to_table()
         return table._repr_html_()
 
+    def _lookup_species(self, name: str) -> StrOrNone:
+        """returns the species name for any of latin, common or ensembl name"""
+        key = _make_key(name)
+        if key in self._species_common:
+            return self._ensembl_species[self._species_ensembl[key]]
+        if key in self._common_species:
+            return self._common_species[key]
+        return self._ensembl_species.get(key)
+
     def get_common_name(self, name: str, level="raise") -> StrOrNone:
         """returns the common name for the given name (which can be either a
         species name or the ensembl version)"""
-        name = eti_util.CaseInsensitiveString(name)
-        if name in self._ensembl_species:
-            name = self._ensembl_species[name]
-
-        if name in self._species_common:
-            common_name = self._species_common[name]
-        elif name in self._common_species:
-            common_name = name
+        key = _make_key(name)
+        if key in self._ensembl_species:
+            key = _make_key(self._ensembl_species[key])
+
+        if key in self._species_common:
+            common_name = self._species_common[key]
+        elif key in self._common_species:
+            common_name = self._species_common[_make_key(self._common_species[key])]
         else:
             common_name = None
 
@@ -86,17 +103,10 @@ class SpeciesNameMap:
 
     def get_species_name(self, name: str, level="ignore") -> StrOrNone:
         """returns the species name for the given common name"""
-        name = eti_util.CaseInsensitiveString(name)
-        if name in self._species_common:
-            return name
-
-        species_name = None
-        level = level.lower().strip()
-        for data in [self._common_species, self._ensembl_species]:
-            if name in data:
-                species_name = data[name]
+        species_name = self._lookup_species(name)
         if species_name is None:
             msg = f"Unknown common name: {name}"
+            level = level.lower().strip()
             if level == "raise":
                 raise ValueError(msg)
             if level == "warn":
@@ -106,22 +116,19 @@ class SpeciesNameMap:
 
     def get_species_names(self) -> typing.Sequence[StrOrNone]:
         """returns the list of species names"""
-        return sorted(self._species_common.keys())
+        return sorted(self._ensembl_species.values())
 
     def get_ensembl_db_prefix(self, name: str) -> str:
         """returns a string of the species name in the format used by
         ensembl"""
-        name = eti_util.CaseInsensitiveString(name)
-        if name in self._common_species:
-            name = self._common_species[name]
-        try:
-            species_name = self.get_species_name(name, level="raise")
-        except ValueError as e:
-            if name not in self._species_common:
-                raise ValueError(f"Unknown name {name}") from e
-            species_name = name
-
-        return str(species_name.lower().replace(" ", "_"))
+        key = _make_key(name)
+        if key in self._ensembl_species:
+            return key
+        if (species_name := self._lookup_species(key)) is not None:
+            return self._species_ensembl[_make_key(species_name)]
+
+        msg = f"Unknown name {name}"
+        raise ValueError(msg)
 
     def get_db_prefix_from_stableid(self, stableid: str) -> str:
         """returns the db name from a stableid"""
@@ -131,28 +138,29 @@ class SpeciesNameMap:
 
     def _purge_species(self, species_name):
         """removes a species record"""
-        species_name = eti_util.CaseInsensitiveString(species_name)
-        if species_name not in self._species_common:
+        key = _make_key(species_name)
+        if key not in self._species_common:
             return
-        common_name = self._species_common.pop(species_name)
-        ensembl_name = self._species_ensembl.pop(species_name)
+        common_name = self._species_common.pop(key)
+        ensembl_name = self._species_ensembl.pop(key)
         self._ensembl_species.pop(ensembl_name)
-        self._common_species.pop(common_name)
+        self._common_species.pop(_make_key(common_name))
 
     def amend_species(self, species_name, common_name, stableid_prefix=None):
         """add a new species, and common name"""
-        species_name = eti_util.CaseInsensitiveString(species_name)
-        common_name = eti_util.CaseInsensitiveString(common_name)
+        species_name, common_name = str(species_name), str(common_name)
         assert "_" not in species_name, "'_' in species_name, not a Latin name?"
         self._purge_species(species_name)  # remove if existing
-        self._species_common[species_name] = common_name
-        self._common_species[common_name] = species_name
-        ensembl_name = species_name.lower().replace(" ", "_")
-        self._species_ensembl[species_name] = ensembl_name
+        # only stored keys are interned, not every lookup query
+        key = sys.intern(_make_key(species_name))
+        self._species_common[key] = common_name
+        self._common_species[sys.intern(_make_key(common_name))] = species_name
+        ensembl_name = sys.intern(key.replace(" ", "_"))
+        self._species_ensembl[key] = ensembl_name
         self._ensembl_species[ensembl_name] = species_name
         if stableid_prefix:
             # make sure stableid just a string
-            for prefix in stableid_prefix.split(","):
+            for prefix in str(stableid_prefix).split(","):
                 self._stableid_species[prefix] = ensembl_name
 
     def add_stableid_prefix(
@@ -167,9 +175,9 @@ class SpeciesNameMap:
     def to_table(self):
         """returns cogent3 Table"""
         rows = []
-        for common in self._common_species:
-            species = self._common_species[common]
-            ensembl = self._species_ensembl[species]
+        for key, common in self._species_common.items():
+            ensembl = self._species_ensembl[key]
+            species = self._ensembl_species[ensembl]
             # all prefixes for this species
             stableids = ",".join(
                 [k for k, v in self._stableid_species.items() if v == ensembl],
@@ -1,6 +1,10 @@
+import concurrent.futures
 import contextlib
+import fnmatch
 import functools
 import inspect
+import itertools
+import multiprocessing
 import os
 import pathlib
 import re
@@ -16,6 +20,7 @@ from typing import IO
 
 import blosc2
 import hdf5plugin
+import loky
 import numba
 import numpy
 import typing_extensions
@@ -445,15 +450,72 @@ def strip_quotes(text: str) -> str:
     return _quotes.sub("", text)
 
 
+def _bounded_as_completed(
+    func: typing.Callable,
+    series: typing.Iterable,
+    max_workers: int | None,
+    max_pending: int,
+) -> typing.Iterator:
+    """yields results as they complete, submitting the next element of series
+    as each result is yielded, so at most max_pending tasks are outstanding
+
+    Notes
+    -----
+    Uses the loky executor, and worker cap, of cogent3's as_completed.
+    """
+    num_cpus = multiprocessing.cpu_count()
+    if not max_workers or max_workers > num_cpus:
+        max_workers = max(1, num_cpus - 1)
+
+    series = iter(series)
+    with loky.get_reusable_executor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(func, item)
+            for item in itertools.islice(series, max_pending)
+        }
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                yield future.result()
+                for item in itertools.islice(series, 1):
+                    pending.add(executor.submit(func, item))
+
+
 def get_iterable_tasks(
     *,
     func: typing.Callable,
     series: typing.Sequence,
     max_workers: int | None,
+    max_pending: int | None = None,
     **kwargs: dict,
 ) -> typing.Iterator:
+    """returns an iterator of func applied to each element of series
+
+    Parameters
+    ----------
+    func
+        callable applied to each element
+    series
+        the elements
+    max_workers
+        number of worker processes, 1 means serial
+    max_pending
+        if provided, the maximum number of tasks submitted but whose result
+        has not been consumed. Use this when results are large and are
+        consumed as they arrive.
+    kwargs
+        passed to cogent3's as_completed, cannot be combined with max_pending
+    """
     if max_workers == 1:
         return map(func, series)
+    if max_pending:
+        if kwargs:
+            msg = f"{sorted(kwargs)} cannot be used with max_pending"
+            raise TypeError(msg)
+        return _bounded_as_completed(func, series, max_workers, max_pending)
     return as_completed(func, series, max_workers=max_workers, **kwargs)
 
 
@@ -568,5 +630,66 @@ def tempdir(working_dir: pathlib.Path | str | None = None) -> pathlib.Path:
         yield pathlib.Path(temp_dir)
 
 
+@contextlib.contextmanager
+def blosc_nthreads(nthreads: int | None) -> typing.Iterator[None]:
+    """context manager setting the number of threads used by the blosc2
+    HDF5 filter
+
+    Notes
+    -----
+    The filter reads the BLOSC_NTHREADS environment variable on each
+    compression call. The original value is restored on exit.
+    """
+    if not nthreads or nthreads < 1:
+        yield
+        return
+
+    orig = os.environ.get("BLOSC_NTHREADS")
+    os.environ["BLOSC_NTHREADS"] = str(nthreads)
+    try:
+        yield
+    finally:
+        if orig is None:
+            os.environ.pop("BLOSC_NTHREADS", None)
+        else:
+            os.environ["BLOSC_NTHREADS"] = orig
+
+
+def get_spare_threads(num_workers: int | None) -> int:
+    """returns the number of threads available to each of num_workers
+    processes, at least 1"""
+    num_workers = num_workers or 1
+    return max(1, (os.cpu_count() or 1) // num_workers)
+
+
+def scandir_matching(path: PathType, pattern: str) -> list[str]:
+    """returns paths of files in directory path whose name matches pattern
+
+    Parameters
+    ----------
+    path
+        directory to scan, a missing directory returns an empty list
+    pattern
+        a glob pattern applied to file names
+
+    Notes
+    -----
+    Uses a single os.scandir call and returns strings, avoiding
+    construction of a pathlib.Path per entry. As for glob, names starting
+    with "." are excluded.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if not entry.name.startswith(".")
+                and fnmatch.fnmatchcase(entry.name, pattern)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def make_column_constant(schema: tuple[str, ...]) -> tuple[str, ...]:
     return tuple(c.split()[0] for c in schema)
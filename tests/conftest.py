@@ -1,3 +1,4 @@
+import multiprocessing
 import pathlib
 import shutil
 from configparser import ConfigParser
@@ -19,6 +20,23 @@ def ENSEMBL_RELEASE_VERSION() -> str:
     return "113"
 
 
+@pytest.fixture(
+    params=[
+        1,
+        pytest.param(
+            2,
+            marks=pytest.mark.skipif(
+                multiprocessing.cpu_count() < 3,
+                reason="cogent3 needs a spare cpu for each worker",
+            ),
+        ),
+    ],
+)
+def max_workers(request):
+    """serial and parallel worker counts for install functions"""
+    return request.param
+
+
 @pytest.fixture
 def tmp_dir(tmp_path_factory):
     return tmp_path_factory.mktemp("cli")
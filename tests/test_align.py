@@ -157,6 +157,29 @@ def test_aligndb_records_skip_duplicated_block_ids(small_records):
     assert agg.sql(sql).fetchone()[0] == count
 
 
+def test_aligndb_records_unique_align_ids():
+    agg, gs = empty_align_agg_gap_store()
+    records = make_records(1, 5, 0) + make_records(1, 5, 1)
+    eti_ingest_align.add_records(conn=agg, gap_store=gs, records=records[:3])
+    eti_ingest_align.add_records(conn=agg, gap_store=gs, records=records[3:])
+    got = [r[0] for r in agg.sql("SELECT align_id FROM align_blocks").fetchall()]
+    assert len(got) == len(records)
+    assert len(set(got)) == len(got)
+
+
+def test_aligndb_records_rollback_on_error():
+    agg, gs = empty_align_agg_gap_store()
+    records = make_records(1, 5, 0)
+    records[-1].start = "not an int"
+    with pytest.raises(duckdb.Error):
+        eti_ingest_align.add_records(conn=agg, gap_store=gs, records=records)
+    # the failed insert leaves no rows and no open transaction
+    assert agg.sql("SELECT COUNT(*) FROM align_blocks").fetchone()[0] == 0
+    records = make_records(1, 5, 1)
+    eti_ingest_align.add_records(conn=agg, gap_store=gs, records=records)
+    assert agg.sql("SELECT COUNT(*) FROM align_blocks").fetchone()[0] == len(records)
+
+
 # fixture to make synthetic GenomeSeqsDb and alignment db
 # based on a given alignment
 @pytest.fixture
@@ -596,3 +619,64 @@ def test_aligndb_close(db_align):
     db_align.close()
     with pytest.raises(duckdb.duckdb.ConnectionException):
         db_align.num_records()
+
+
+def test_install_alignment_duplicate_blocks_across_files(
+    DATA_DIR,
+    tmp_dir,
+    max_workers,
+):
+    align_name = "align_name"
+    cfg = eti_config.Config(
+        host="localhost",
+        remote_path="",
+        staging_path=tmp_dir / "staging",
+        install_path=tmp_dir / "install",
+        species_dbs={},
+        release="113",
+        align_names=[align_name],
+        tree_names=[],
+        homologies=True,
+    )
+    align_dir = cfg.staging_aligns / align_name
+    align_dir.mkdir(parents=True, exist_ok=True)
+    data = (DATA_DIR / "tiny.maf").read_text()
+    # the same blocks present in two files are only installed once
+    for i in range(2):
+        (align_dir / f"{align_name}.{i}.maf").write_text(data)
+
+    parquet_path = eti_ingest_align.install_alignment(
+        cfg,
+        align_name,
+        max_workers=max_workers,
+    )
+    db = eti_align.AlignDb(source=parquet_path.parent)
+    assert db.num_records() == 3
+
+
+@pytest.mark.parametrize(
+    "seq",
+    ["AC--GT-", "--AC", "ACGT", "-", "A?-C", "---", "A-C-G--T----"],
+)
+def test_get_gap_spans(seq):
+    from cogent3 import make_seq
+
+    imap, _ = make_seq(seq, moltype="dna", new_type=True).parse_out_gaps()
+    got = eti_ingest_align.get_gap_spans(seq)
+    if imap.num_gaps:
+        expect = numpy.array([imap.gap_pos, imap.get_gap_lengths()]).T
+    else:
+        expect = numpy.array([], dtype=numpy.int32)
+    assert got.dtype == numpy.int32
+    numpy.testing.assert_array_equal(got, expect)
+
+
+@pytest.mark.parametrize(
+    ("species", "expect"),
+    [(None, {"homo_sapiens", "mouse", "rat"}), ({"mouse", "rat"}, {"mouse", "rat"})],
+)
+def test_load_align_records_species(DATA_DIR, species, expect):
+    loader = eti_ingest_align.load_align_records(species)
+    got = loader.main(DATA_DIR / "tiny.maf")
+    assert {r.species for r in got} == expect
+    assert {r.source for r in got} == {"tiny.maf"}
@@ -24,6 +24,13 @@ def test_installed_homologies():
     assert cfg.homologies_path == pathlib.Path("abcd/compara/homologies")
 
 
+def test_config_paths_cached(tmp_config):
+    config = eti_config.read_config(tmp_config)
+    assert config.staging_genomes is config.staging_genomes
+    assert config.install_aligns is config.install_aligns
+    assert config.install_homologies == config.install_path / "compara/homologies"
+
+
 def test_read_installed(tmp_config, tmp_path):
     config = eti_config.read_config(tmp_config)
     outpath = eti_config.write_installed_cfg(config)
@@ -159,3 +166,53 @@ def test_read_config_genomes(cfg_just_genomes):
     config = eti_config.read_config(cfg_just_genomes)
     expected = {Species.get_species_name(n) for n in COMMON_NAMES}
     assert set(config.species_dbs.keys()) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expect"),
+    [
+        ("a", ["a"]),
+        (" a , b ", ["a", "b"]),
+        ("a,,b,", ["a", "b"]),
+        ("", []),
+    ],
+)
+def test_split_csv(value, expect):
+    parser = configparser.ConfigParser()
+    parser.read_dict({"compara": {"align_names": value}})
+    assert eti_config._split_csv(parser, "compara", "align_names") == expect
+
+
+def test_split_csv_missing():
+    parser = configparser.ConfigParser()
+    parser.read_dict({"compara": {}})
+    assert eti_config._split_csv(parser, "compara", "tree_names") == []
+    with pytest.raises(configparser.NoOptionError):
+        eti_config._split_csv(parser, "compara", "tree_names", required=True)
+
+
+def test_config_db_names_updated(tmp_config):
+    config = eti_config.read_config(tmp_config)
+    orig = config.db_names
+    assert isinstance(orig, tuple)
+    assert config.db_names is orig
+    config.update_species({"mouse": ["core"], "Mus musculus": ["core"]})
+    assert config.db_names == (*orig, "mus_musculus")
+
+
+def test_config_write_no_species(tmp_path):
+    # e.g. when no species are found for the requested alignments
+    config = eti_config.Config(
+        host="localhost",
+        remote_path="",
+        release="113",
+        staging_path=tmp_path / "staging",
+        install_path=tmp_path / "install",
+        species_dbs={},
+        align_names=[],
+        tree_names=[],
+        homologies=False,
+    )
+    assert config.db_names == ()
+    config.write()
+    assert (config.staging_path / eti_config.DOWNLOADED_CONFIG_NAME).exists()
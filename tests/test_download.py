@@ -21,3 +21,39 @@ def test_make_dumpfiles():
     assert {
         n.split(".")[0] for n in table_names - {"CHECKSUMS"}
     } == eti_db_attr.get_all_tables()
+
+
+def test_download_ensembl_tree_cached(DATA_DIR, tmp_path, monkeypatch):
+    from cogent3 import load_tree
+
+    calls = []
+
+    def fake_load_tree(url):
+        calls.append(url)
+        return load_tree(DATA_DIR / "HBB_gene_tree.nh")
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(eti_download.cogent3, "load_tree", fake_load_tree)
+    eti_download._get_ensembl_treestring.cache_clear()
+    args = "ftp.ensembl.org", "pub", "113", "HBB_gene_tree.nh"
+    expect = set(load_tree(DATA_DIR / "HBB_gene_tree.nh").get_tip_names())
+
+    tree = eti_download.download_ensembl_tree(*args)
+    assert set(tree.get_tip_names()) == expect
+    assert len(calls) == 1
+    # in-process cache
+    _ = eti_download.download_ensembl_tree(*args)
+    assert len(calls) == 1
+    # on-disk cache
+    eti_download._get_ensembl_treestring.cache_clear()
+    tree = eti_download.download_ensembl_tree(*args)
+    assert set(tree.get_tip_names()) == expect
+    assert len(calls) == 1
+    assert list(tmp_path.glob("ensembl_tui/trees/*/pub/113/HBB_gene_tree.nh"))
+    # a different remote path is a different cache entry
+    args = "ftp.ensembl.org", "/pub/plants/", "113", "HBB_gene_tree.nh"
+    _ = eti_download.download_ensembl_tree(*args)
+    assert len(calls) == 2
+    assert calls[-1] != calls[0]
+    assert list(tmp_path.glob("ensembl_tui/trees/*/pub/plants/113/HBB_gene_tree.nh"))
+    eti_download._get_ensembl_treestring.cache_clear()
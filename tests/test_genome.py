@@ -172,3 +172,41 @@ def test_get_features(yeast):
 def test_get_ids_for_biotype(yeast):
     features = list(yeast.get_ids_for_biotype(biotype="rRNA", limit=10))
     assert len(features) == 10
+
+
+def test_seqs_data_add_duplicate_record():
+    seqs = eti_genome.SeqsDataHdf5(source="memory", species="human", mode="w")
+    seqs.add_record("ACGGT", "s1")
+    # identical duplicate is ignored
+    seqs.add_record("ACGGT", "s1")
+    assert seqs.get_seq_str(seqid="s1") == "ACGGT"
+
+
+@pytest.mark.parametrize("seq", ["ACGGA", "ACGG", "ACGGTT"])
+def test_seqs_data_add_invalid_duplicate_record(seq):
+    seqs = eti_genome.SeqsDataHdf5(source="memory", species="human", mode="w")
+    seqs.add_record("ACGGT", "s1")
+    with pytest.raises(ValueError, match="already present"):
+        seqs.add_record(seq, "s1")
+
+
+def test_fasta_to_hdf5(tmp_config):
+    import gzip
+
+    from ensembl_tui import _config as eti_config
+
+    config = eti_config.read_config(tmp_config)
+    db_name = "saccharomyces_cerevisiae"
+    src_dir = config.staging_genomes / db_name / "fasta"
+    src_dir.mkdir(parents=True)
+    with gzip.open(src_dir / "demo.fa.gz", "wt") as out:
+        out.write(">I chromosome:R64\nACGGT\nTTA\n>II chromosome:R64\nGGGC\n")
+    (config.install_genomes / db_name).mkdir(parents=True)
+
+    writer = eti_genome.fasta_to_hdf5(config=config, nthreads=2)
+    assert writer(db_name)
+    seqs = eti_genome.SeqsDataHdf5(
+        source=config.install_genomes / db_name / eti_genome.SEQ_STORE_NAME,
+    )
+    assert set(seqs.get_coord_names()) == {"I", "II"}
+    assert seqs.get_seq_str(seqid="I") == "ACGGTTTA"
@@ -314,3 +314,23 @@ def test_extract_homology_data(hom_dir):
     for result in loader.as_completed(hom_dir.glob("*.tsv.gz"), show_progress=False):
         records.extend(result.obj)
     assert len(records) == 2
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 50_000])
+def test_homology_add_records_batched(hom_records, batch_size):
+    groups = homol_ingest.grouped_related(hom_records)
+    agg = homol_ingest.make_homology_aggregator_db()
+    for rel_type, data in groups.items():
+        agg.add_records(records=data, relationship_type=rel_type, batch_size=batch_size)
+    sql = "SELECT homology_id, stableid FROM homology_groups_attr"
+    got = agg.conn.sql(sql).fetchall()
+    assert len(got) == 7
+    # three distinct groups, with unique ids across relationship types
+    assert len({hid for hid, _ in got}) == 3
+
+
+def test_homology_add_records_empty():
+    agg = homol_ingest.make_homology_aggregator_db()
+    agg.add_records(records=[], relationship_type="ortholog_one2one")
+    sql = "SELECT COUNT(*) FROM homology_groups_attr"
+    assert agg.conn.sql(sql).fetchone()[0] == 0
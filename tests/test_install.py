@@ -634,3 +634,118 @@ def test_make_transcript_attr(mixed_data):
     spans = eti_storage.blob_to_array(result)
     expect = numpy.array([[900, 1000], [1100, 1200], [1300, 1400]], dtype=numpy.int32)
     assert numpy.allclose(spans, expect)
+
+
+def test_local_install_homology(DATA_DIR, tmp_path, max_workers):
+    from ensembl_tui import _homology as eti_homology
+    from ensembl_tui import _install as eti_install
+
+    species = {
+        "Gorilla gorilla": ["core"],
+        "Homo sapiens": ["core"],
+        "Pan paniscus": ["core"],
+        "Pan troglodytes": ["core"],
+        "Pongo abelii": ["core"],
+        "Macaca mulatta": ["core"],
+        "Macaca fascicularis": ["core"],
+        "Chlorocebus sabaeus": ["core"],
+        "Microcebus murinus": ["core"],
+    }
+    config = eti_config.Config(
+        host="localhost",
+        remote_path="",
+        release="113",
+        staging_path=tmp_path / "staging",
+        install_path=tmp_path / "install",
+        species_dbs=species,
+        align_names=[],
+        tree_names=[],
+        homologies=True,
+    )
+    sp_dir = config.staging_homologies / "homo_sapiens"
+    sp_dir.mkdir(parents=True)
+    shutil.copy(DATA_DIR / "one2one_homologies.tsv", sp_dir)
+    eti_install.local_install_homology(
+        config,
+        force_overwrite=False,
+        max_workers=max_workers,
+    )
+    homdb = eti_homology.HomologyDb(source=config.install_homologies)
+    assert homdb.num_records() == 5
+
+
+class _stub_writer:  # noqa: N801
+    """picklable stand-in for the genome install writers, records each call
+    as a file in the species install directory"""
+
+    def __init__(self, kind, config, nthreads=None):
+        self.kind = kind
+        self.install = config.install_genomes
+        self.nthreads = nthreads
+
+    def __call__(self, db_name):
+        (self.install / db_name / self.kind).write_text(str(self.nthreads))
+        return True
+
+
+@pytest.mark.parametrize("max_workers", [1, 3, 100])
+def test_local_install_genomes(monkeypatch, tmp_path, max_workers):
+    import functools
+
+    from rich.progress import Progress
+
+    from ensembl_tui import _genome as eti_genome
+    from ensembl_tui import _install as eti_install
+    from ensembl_tui import _util as eti_util
+
+    monkeypatch.setattr(
+        eti_db_ingest,
+        "mysql_dump_to_parquet",
+        functools.partial(_stub_writer, "features"),
+    )
+    monkeypatch.setattr(
+        eti_genome,
+        "fasta_to_hdf5",
+        functools.partial(_stub_writer, "seqs"),
+    )
+    # record the scheduling arguments, but run the tasks serially
+    calls = []
+    get_iterable_tasks = eti_util.get_iterable_tasks
+
+    def record_tasks(*, func, series, max_workers):
+        calls.append((len(series), max_workers))
+        return get_iterable_tasks(func=func, series=series, max_workers=1)
+
+    monkeypatch.setattr(eti_util, "get_iterable_tasks", record_tasks)
+    monkeypatch.setattr(eti_util.os, "cpu_count", lambda: 8)
+
+    config = eti_config.Config(
+        host="localhost",
+        remote_path="",
+        release="113",
+        staging_path=tmp_path / "staging",
+        install_path=tmp_path / "install",
+        species_dbs={"Homo sapiens": ["core"], "Saccharomyces cerevisiae": ["core"]},
+        align_names=[],
+        tree_names=[],
+        homologies=False,
+    )
+    db_names = config.db_names
+    progress = Progress(disable=True)
+    eti_install.local_install_genomes(
+        config,
+        force_overwrite=True,
+        max_workers=max_workers,
+        progress=progress,
+    )
+    # both phases for every species are scheduled on the one pool
+    num_tasks = 2 * len(db_names)
+    assert calls == [(num_tasks, min(num_tasks, max_workers))]
+    # spare threads are shared between concurrent seqs tasks only
+    nthreads = str(8 // min(len(db_names), max_workers))
+    for db_name in db_names:
+        assert (config.install_genomes / db_name / "features").exists()
+        assert (config.install_genomes / db_name / "seqs").read_text() == nthreads
+    # each phase has its own progress task that completes
+    assert len(progress.tasks) == 2
+    assert all(task.completed == len(db_names) for task in progress.tasks)
@@ -29,3 +29,56 @@ def test_process_maf_line_plus(line):
     # maf is zero based
     assert n.start == 2
     assert n.stop == 2 + 7
+
+
+def test_read_excludes_ancestral(DATA_DIR):
+    path = DATA_DIR / "sample.maf"
+    for _, block in eti_maf.parse(path):
+        assert all(n.species != "ancestral_sequences" for n, _ in block)
+
+
+def test_read_final_block_complete(tmp_path):
+    # the last block ends at end-of-file, not at another id line
+    data = "\n".join(
+        (
+            "##maf version=1",
+            "# id: 1",
+            "a",
+            "s pan_paniscus.11 2 7 + 13 ACTCTCCAGATGA",
+            "s homo_sapiens.1 2 7 + 13 ACTCTCCAGATGA",
+        ),
+    )
+    path = tmp_path / "final.maf"
+    path.write_text(data)
+    blocks = list(eti_maf.parse(path))
+    assert len(blocks) == 1
+    block_id, block = blocks[0]
+    assert block_id == 1
+    assert [n.species for n, _ in block] == ["pan_paniscus", "homo_sapiens"]
+
+
+def test_process_maf_line_dotted_seqid():
+    n, _ = eti_maf.process_maf_line("s homo_sapiens.KI270.1 2 7 + 13 ACTCTCCAGATGA")
+    assert n.species == "homo_sapiens"
+    assert n.seqid == "KI270.1"
+
+
+def test_process_maf_line_invalid():
+    with pytest.raises(ValueError):
+        eti_maf.process_maf_line("i pan_paniscus.11 N 0 C 0")
+
+
+def test_process_maf_line_reuses_names():
+    line = "s pan_paniscus.11 2 7 + 13 ACTCTCCAGATGA"
+    n1, _ = eti_maf.process_maf_line(line)
+    n2, _ = eti_maf.process_maf_line(line[:-1] + "T")
+    assert n1.species is n2.species
+    assert n1.seqid is n2.seqid
+
+
+def test_reuse_str_capped(monkeypatch):
+    monkeypatch.setattr(eti_maf, "_max_cached_names", 2)
+    cache = {}
+    got = [eti_maf._reuse_str(cache, v) for v in ("a", "b", "c", "a")]
+    assert got == ["a", "b", "c", "a"]
+    assert set(cache) == {"a", "b"}
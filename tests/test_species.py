@@ -117,3 +117,26 @@ def test_db_prefix_from_stableid_fail(invalid):
 def test_db_prefixes_from_stablesids(stableid, expect):
     got = Species.get_db_prefix_from_stableid(stableid)
     assert got == expect
+
+
+@pytest.mark.parametrize(
+    "name",
+    ("HUMAN", "homo sapiens", "HOMO_SAPIENS", "Homo Sapiens"),
+)
+def test_case_insensitive_lookups(name):
+    assert name in Species
+    assert Species.get_species_name(name) == "Homo sapiens"
+    assert Species.get_common_name(name) == "Human"
+    assert Species.get_ensembl_db_prefix(name) == "homo_sapiens"
+
+
+def test_amend_species_updates_lookups():
+    from ensembl_tui._species import SpeciesNameMap
+
+    species = SpeciesNameMap(species_common=[["Homo sapiens", "Human", "ENS"]])
+    assert species.get_ensembl_db_prefix("human") == "homo_sapiens"
+    species.amend_species("Homo sapiens", "Person")
+    assert species.get_species_name("human") is None
+    with pytest.raises(ValueError):
+        species.get_ensembl_db_prefix("human")
+    assert species.get_ensembl_db_prefix("person") == "homo_sapiens"
@@ -319,3 +319,86 @@ def test_category_indexer_iter():
     _ = [indexer(cat, grp) for cat, grp in data]
     got = set(indexer)
     assert got == expect
+
+
+@pytest.mark.parametrize("orig", [None, "2"])
+def test_blosc_nthreads(monkeypatch, orig):
+    import os
+
+    if orig is None:
+        monkeypatch.delenv("BLOSC_NTHREADS", raising=False)
+    else:
+        monkeypatch.setenv("BLOSC_NTHREADS", orig)
+
+    with eti_util.blosc_nthreads(4):
+        assert os.environ["BLOSC_NTHREADS"] == "4"
+    assert os.environ.get("BLOSC_NTHREADS") == orig
+
+
+@pytest.mark.parametrize("nthreads", [None, 0])
+def test_blosc_nthreads_unset(monkeypatch, nthreads):
+    import os
+
+    monkeypatch.delenv("BLOSC_NTHREADS", raising=False)
+    with eti_util.blosc_nthreads(nthreads):
+        assert "BLOSC_NTHREADS" not in os.environ
+
+
+@pytest.mark.parametrize(
+    ("num_workers", "expect"),
+    [(None, 8), (1, 8), (2, 4), (3, 2), (16, 1)],
+)
+def test_get_spare_threads(monkeypatch, num_workers, expect):
+    monkeypatch.setattr(eti_util.os, "cpu_count", lambda: 8)
+    assert eti_util.get_spare_threads(num_workers) == expect
+
+
+@pytest.mark.parametrize("max_pending", [1, 3, 20])
+def test_get_iterable_tasks_bounded(max_pending):
+    pulled = []
+
+    def series():
+        for v in range(-5, 5):
+            pulled.append(v)
+            yield v
+
+    got = []
+    for result in eti_util.get_iterable_tasks(
+        func=abs,
+        series=series(),
+        max_workers=2,
+        max_pending=max_pending,
+    ):
+        # the next task is submitted only once a result is consumed
+        assert len(pulled) - len(got) <= max_pending
+        got.append(result)
+    assert sorted(got) == sorted(abs(v) for v in range(-5, 5))
+
+
+def test_get_iterable_tasks_bounded_kwargs():
+    with pytest.raises(TypeError, match="max_pending"):
+        eti_util.get_iterable_tasks(
+            func=abs,
+            series=[1],
+            max_workers=2,
+            max_pending=2,
+            if_serial="ignore",
+        )
+
+
+def test_get_iterable_tasks_serial():
+    got = eti_util.get_iterable_tasks(func=abs, series=[-1, 2], max_workers=1)
+    assert list(got) == [1, 2]
+
+
+def test_scandir_matching(tmp_path):
+    for name in ("a.fa.gz", "b.fa.gz", "c.gff3.gz", ".d.fa.gz"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "e.fa.gz").mkdir()
+    got = eti_util.scandir_matching(tmp_path, "*.fa.gz")
+    assert all(isinstance(p, str) for p in got)
+    assert sorted(got) == [str(tmp_path / "a.fa.gz"), str(tmp_path / "b.fa.gz")]
+
+
+def test_scandir_matching_missing(tmp_path):
+    assert eti_util.scandir_matching(tmp_path / "missing", "*") == []